@@ -1,4 +1,6 @@
 import functools
+import itertools
+import json
 from typing import (
     Optional,
     Type,
@@ -10,18 +12,20 @@ from typing import (
     List,
     TypeVar,
     get_type_hints,
+    get_origin,
     Callable,
     Generic,
-    Hashable,
     ClassVar,
 )
-import re
+import collections.abc
 from datetime import datetime
-from dataclasses import fields, is_dataclass, Field, MISSING, dataclass, asdict
+from dataclasses import fields, is_dataclass, Field, MISSING, dataclass
 from uuid import UUID
 from enum import Enum
 import threading
+import types
 import warnings
+import weakref
 
 from dateutil.parser import parse
 import jsonschema
@@ -39,6 +43,22 @@ JsonDict = Dict[str, Any]
 
 OPTIONAL_TYPES = ["Union", "Optional"]
 
+# Maps generic-alias origins to the names the dispatch code switches on.
+_ORIGIN_NAMES = {
+    list: "List",
+    dict: "Dict",
+    tuple: "Tuple",
+    Union: "Union",
+    collections.abc.Sequence: "Sequence",
+    collections.abc.Mapping: "Mapping",
+}
+
+# PEP 604 unions ('list[str] | str | None') have their own origin type on
+# python >= 3.10 but expose the same __args__ as typing.Union, so the
+# union machinery handles them unchanged once the name maps across
+if hasattr(types, "UnionType"):
+    _ORIGIN_NAMES[types.UnionType] = "Union"
+
 
 class ValidationError(jsonschema.ValidationError):
     pass
@@ -75,10 +95,25 @@ class FutureValidationError(ValidationError):
         return super().__str__()
 
 
+_CachedF = TypeVar("_CachedF", bound=Callable[..., Any])
+
+
+def _bounded_cache(func: _CachedF) -> _CachedF:
+    """lru_cache for the type-keyed helpers: bounded, so dynamically
+    created classes age out instead of being pinned by the cache forever,
+    and cast back to the wrapped signature so type-object arguments
+    type-check (typeshed models the wrapper's parameters as Hashable,
+    which type objects famously fail).
+    """
+    return cast(_CachedF, functools.lru_cache(maxsize=1024)(func))
+
+
+@_bounded_cache
 def is_enum(field_type: Any) -> bool:
     return issubclass_safe(field_type, Enum)
 
 
+@_bounded_cache
 def issubclass_safe(klass: Any, base: Type) -> bool:
     try:
         return issubclass(klass, base)
@@ -86,14 +121,12 @@ def issubclass_safe(klass: Any, base: Type) -> bool:
         return False
 
 
+@_bounded_cache
 def is_optional(field: Any) -> bool:
-    if str(field).startswith("typing.Union") or str(field).startswith(
-        "typing.Optional"
-    ):
-        for arg in field.__args__:
-            if isinstance(arg, type) and issubclass(arg, type(None)):
-                return True
-
+    # covers typing.Optional, typing.Union, and PEP 604 unions alike,
+    # without the string rendering the old startswith checks relied on
+    if _ORIGIN_NAMES.get(get_origin(field)) == "Union":
+        return type(None) in field.__args__
     return False
 
 
@@ -153,21 +186,21 @@ class UuidField(FieldEncoder[UUID]):
         }
 
 
-_ValueEncoder = Callable[[Any, Any, bool], Any]
-_ValueDecoder = Callable[[str, Any, Any], Any]
-
-T = TypeVar("T", bound="JsonSchemaMixin")
+# Compiled encoders take (value, omit_none); compiled decoders take
+# (field_name, value, validate). Both are specialized to a concrete field
+# type when they are built, so no type inspection happens at call time.
+_ValueEncoder = Callable[[Any, bool], Any]
+_ValueDecoder = Callable[[str, Any, bool], Any]
 
+# The exceptions that signal "this union variant didn't match, try the next"
+_UNION_DECODE_EXCEPTIONS = (
+    AttributeError,
+    TypeError,
+    ValueError,
+    ValidationError,
+)
 
-@functools.lru_cache()
-def _to_camel_case(value: str) -> str:
-    if "_" in value:
-        parts = value.split("_")
-        return "".join(
-            [parts[0]] + [part[0].upper() + part[1:] for part in parts[1:]]
-        )
-    else:
-        return value
+T = TypeVar("T", bound="JsonSchemaMixin")
 
 
 @dataclass
@@ -177,18 +210,25 @@ class FieldMeta:
 
     @property
     def as_dict(self) -> Dict:
-        return {
-            _to_camel_case(k): v
-            for k, v in asdict(self).items()
-            if v is not None
-        }
-
-
-@functools.lru_cache()
-def _validate_schema(h_schema_cls: Hashable) -> JsonDict:
-    schema_cls = cast(Type[JsonSchemaMixin], h_schema_cls)  # making mypy happy
-    schema = schema_cls.json_schema()
-    jsonschema.Draft7Validator.check_schema(schema)
+        # asdict() deep-copies the whole dataclass, which is overkill for
+        # two flat attributes whose keys need no camel-casing
+        result: Dict = {}
+        if self.default is not None:
+            result["default"] = self.default
+        if self.description is not None:
+            result["description"] = self.description
+        return result
+
+
+def _validate_schema(schema_cls: Type["JsonSchemaMixin"]) -> JsonDict:
+    # memoized on the class itself (via cls.__dict__, so subclasses don't
+    # inherit a parent's checked schema) rather than an lru_cache, so
+    # _invalidate_schema_cache can drop it per class
+    schema = schema_cls.__dict__.get("_checked_schema")
+    if schema is None:
+        schema = schema_cls.json_schema()
+        jsonschema.Draft7Validator.check_schema(schema)
+        schema_cls._checked_schema = schema
     return schema
 
 
@@ -200,18 +240,22 @@ Restriction = List[Tuple[Field, str]]
 Variant = Tuple[Type[T], Optional[Restriction]]
 
 
+@_bounded_cache
 def _get_restrictions(variant_type: Type) -> Restriction:
     """Return a list of all restrictions on the given variant of a union, in
     the form of a Field, name pair, where `name` is the field's name in json
     and the Field is the dataclass-level field name.
 
     If the variant isn't a JsonSchemaMixin subclass, there are no restrictions.
+
+    Restrictions are fixed once a class is defined, so the result is
+    memoized per variant type.
     """
     if not issubclass_safe(variant_type, JsonSchemaMixin):
         return []
     restrictions: Restriction = []
     for field, target_name in variant_type._get_fields():
-        if field.metadata and "restrict" in field.metadata:
+        if field.metadata.get("restrict") is not None:
             restrictions.append((field, target_name))
     return restrictions
 
@@ -244,29 +288,114 @@ def get_union_fields(field_type: Union[Any]) -> List[Variant]:
     return fields
 
 
-def _encode_restrictions_met(
-    value: Any, restrict_fields: Optional[List[Tuple[Field, str]]]
-) -> bool:
-    if restrict_fields is None:
-        return True
-    return all(
-        (
-            hasattr(value, f.name)
-            and getattr(value, f.name) in f.metadata["restrict"]
+def _identity_encoder(value: Any, _: bool) -> Any:
+    """Shared encoder for fields that are already JSON encodable."""
+    return value
+
+
+def _enum_encoder(value: Any, _: bool) -> Any:
+    """Shared encoder for enum fields; the value attribute read is the
+    whole job, so every enum type can use this one function."""
+    return value.value if value is not None else None
+
+
+# marks "key/attribute not present" in restriction checks
+_SENTINEL = object()
+
+
+def _always_true(_: Any) -> bool:
+    return True
+
+
+# predicates take a candidate value and report whether a variant's
+# restrictions allow it
+_RestrictionPredicate = Callable[[Any], bool]
+
+
+def _in_allowed(candidate: Any, allowed: frozenset) -> bool:
+    try:
+        return candidate in allowed
+    except TypeError:
+        # an unhashable candidate can't equal any of the (hashable)
+        # restriction values, so it's simply not a match
+        return False
+
+
+def _compile_restriction_predicates(
+    restrictions: Optional[Restriction],
+) -> Tuple[_RestrictionPredicate, _RestrictionPredicate]:
+    """Compile a variant's restrictions into a pair of predicates: one that
+    checks an object's attributes (used when encoding) and one that checks
+    a dict's keys (used when decoding). Unrestricted variants share a
+    single always-true predicate.
+    """
+    if restrictions is None:
+        return _always_true, _always_true
+
+    # a frozenset makes the per-value membership test O(1) even when the
+    # restriction was declared as a list
+    checks = [
+        (f.name, name, frozenset(f.metadata["restrict"]))
+        for f, name in restrictions
+    ]
+
+    def encode_predicate(value: Any) -> bool:
+        # a sentinel default collapses the hasattr/getattr pair (and
+        # hasattr is itself a getattr in disguise) into one lookup
+        return all(
+            _in_allowed(getattr(value, attr, _SENTINEL), allowed)
+            for attr, _, allowed in checks
+        )
+
+    def decode_predicate(value: Any) -> bool:
+        get = getattr(value, "get", None)
+        if get is None:
+            return False
+        return all(
+            _in_allowed(get(name, _SENTINEL), allowed)
+            for _, name, allowed in checks
         )
-        for f, _ in restrict_fields
-    )
 
+    return encode_predicate, decode_predicate
+
+
+def _compile_union_discriminants(
+    union_fields: List[Variant],
+    variants: List[Tuple[str, "_ValueDecoder", _RestrictionPredicate]],
+) -> Optional[Tuple[List[str], Dict[Tuple[Any, ...], List[Any]]]]:
+    """If every variant of a union restricts the same set of json keys,
+    those keys act as a discriminator: the allowed value combinations can
+    be enumerated up front into a table mapping each combination to the
+    variants it selects (several, when restrictions overlap). Returns the
+    shared key list and that table, or None when the union has an
+    unrestricted variant or no key is common to all of them.
+    """
+    if any(restrictions is None for _, restrictions in union_fields):
+        return None
+
+    # allowed values per json key, per variant, in declaration order
+    per_variant = []
+    for (_, restrictions), compiled in zip(union_fields, variants):
+        allowed = {
+            name: frozenset(f.metadata["restrict"])
+            for f, name in restrictions  # type: ignore
+        }
+        per_variant.append((allowed, compiled))
 
-def _decode_restrictions_met(
-    value: Any, restrict_fields: Optional[List[Tuple[Field, str]]]
-) -> bool:
-    if restrict_fields is None:
-        return True
-    return all(
-        n in value and value[n] in f.metadata["restrict"]
-        for f, n in restrict_fields
-    )
+    first = per_variant[0][0]
+    common = [
+        name
+        for name in first
+        if all(name in allowed for allowed, _ in per_variant[1:])
+    ]
+    if not common:
+        return None
+
+    table: Dict[Tuple[Any, ...], List[Any]] = {}
+    for allowed, compiled in per_variant:
+        for combo in itertools.product(*(allowed[name] for name in common)):
+            table.setdefault(combo, []).append(compiled)
+    return common, table
 
 
 @dataclass
@@ -277,6 +406,22 @@ class CompleteSchema:
 
 _HOLOGRAM_LOCK = threading.RLock()
 
+# Every JsonSchemaMixin subclass, registered at class-definition time so
+# "is this a mixin subclass?" is a set probe rather than an issubclass call.
+# A WeakSet so dynamically created classes can still be collected.
+_JSM_SUBCLASSES: "weakref.WeakSet[type]" = weakref.WeakSet()
+
+# Validators shared across classes whose generated schemas are
+# structurally identical, keyed by the canonical JSON dump of the schema.
+# Many simple wrapper dataclasses produce the same shape, and one
+# compiled validator can serve all of them. Kept in LRU order and
+# bounded so dynamically generated classes can't grow it without limit;
+# evicted validators stay alive through any class still holding one.
+_VALIDATORS_BY_SCHEMA: (
+    "collections.OrderedDict[str, jsonschema.Draft7Validator]"
+) = collections.OrderedDict()
+_VALIDATOR_CACHE_SIZE = 1024
+
 
 class JsonSchemaMixin:
     """Mixin which adds methods to generate a JSON schema and
@@ -291,15 +436,49 @@ class JsonSchemaMixin:
     # Cache of the generated schema
     _schema: ClassVar[Optional[Dict[str, CompleteSchema]]] = None
 
+    # Cache of the compiled validator for this class. Looked up via
+    # cls.__dict__ so subclasses don't inherit their parent's validator.
+    _validator: ClassVar[Optional[jsonschema.Draft7Validator]] = None
+
+    # Cache of fully assembled json_schema() results, keyed by the
+    # embeddable flag. Callers are expected to treat these as read-only.
+    _final_schemas: ClassVar[Optional[Dict[bool, JsonDict]]] = None
+
+    # Cache of the schema after a one-time Draft7 meta-schema check
+    _checked_schema: ClassVar[Optional[JsonDict]] = None
+
+    # Whether the top-level schema is an object schema; set alongside
+    # _validator so validate() can reject non-dicts up front
+    _expects_object: ClassVar[bool] = False
+
     # Cache of field encode / decode functions
     _encode_cache: ClassVar[Optional[Dict[Any, _ValueEncoder]]] = None
     _decode_cache: ClassVar[Optional[Dict[Any, _ValueDecoder]]] = None
-    _mapped_fields: ClassVar[
-        Optional[Dict[Any, List[Tuple[Field, str]]]]
+    _mapped_fields: ClassVar[Optional[List[Tuple[Field, str]]]] = None
+
+    # Cache of (name, target, encoder, decoder) records, one per public
+    # field, with the encoder/decoder already compiled for the field's type
+    _field_records: ClassVar[
+        Optional[List[Tuple[str, str, _ValueEncoder, _ValueDecoder]]]
+    ] = None
+
+    # Caches for from_dict: (name, target, decoder, required) records,
+    # split by whether the field is passed to __init__ or set afterwards
+    _decode_records: ClassVar[
+        Optional[
+            Tuple[
+                List[Tuple[str, str, _ValueDecoder, bool]],
+                List[Tuple[str, str, _ValueDecoder, bool]],
+            ]
+        ]
     ] = None
 
     ADDITIONAL_PROPERTIES: ClassVar[bool] = False
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _JSM_SUBCLASSES.add(cls)
+
     @classmethod
     def field_mapping(cls) -> Dict[str, str]:
         """Defines the mapping of python field names to JSON field names.
@@ -318,44 +497,106 @@ class JsonSchemaMixin:
             cls._field_encoders = {**cls._field_encoders, **field_encoders}
         else:
             cls._field_encoders.update(field_encoders)
+        # cached schemas, validators, and compiled encoders all bake in
+        # the encoder registry, so they are stale now
+        cls._invalidate_schema_cache()
+
+    @classmethod
+    def set_validator_cache_size(cls, size: int):
+        """Bound the shared schema-keyed validator cache to `size`
+        entries, evicting the least recently used ones if it is already
+        larger. Classes holding a validator keep it regardless.
+        """
+        global _VALIDATOR_CACHE_SIZE
+        _VALIDATOR_CACHE_SIZE = size
+        while len(_VALIDATORS_BY_SCHEMA) > _VALIDATOR_CACHE_SIZE:
+            _VALIDATORS_BY_SCHEMA.popitem(last=False)
+
+    @classmethod
+    def _invalidate_schema_cache(cls):
+        """Drop the cached schemas, validators, and compiled
+        encoders/decoders for this class and all of its subclasses.
+        """
+        stack = [cls]
+        while stack:
+            klass = stack.pop()
+            for attr in (
+                "_schema",
+                "_validator",
+                "_final_schemas",
+                "_checked_schema",
+                "_encode_cache",
+                "_decode_cache",
+                "_field_records",
+                "_decode_records",
+            ):
+                if attr in klass.__dict__:
+                    setattr(klass, attr, None)
+            stack.extend(klass.__subclasses__())
 
     def _local_to_dict(self, **kwargs):
         return self.to_dict(**kwargs)
 
     @classmethod
-    def _encode_field(
-        cls, field_type: Any, value: Any, omit_none: bool
-    ) -> Any:
-        if value is None:
-            return value
+    def _get_encoder(cls, field_type: Any) -> _ValueEncoder:
+        """Return the compiled encoder for the given field type, building
+        and caching it on first use.
+        """
+        cache = cls.__dict__.get("_encode_cache")
+        if cache is None:
+            cache = {}
+            cls._encode_cache = cache
         try:
-            encoder = cls._encode_cache[field_type]  # type: ignore
-        except (KeyError, TypeError):
-            if cls._encode_cache is None:
-                cls._encode_cache = {}
+            return cache[field_type]
+        except KeyError:
+            encoder = cls._compile_encoder(field_type)
+            cache[field_type] = encoder
+            return encoder
+        except TypeError:
+            # unhashable field types can't be cached
+            return cls._compile_encoder(field_type)
 
-            field_type_name = cls._get_field_type_name(field_type)
-            if field_type in cls._field_encoders:
+    @classmethod
+    def _compile_encoder(cls, field_type: Any) -> _ValueEncoder:
+        """Build an encoder specialized to the given field type. All type
+        inspection happens here, once; the returned closure captures any
+        child encoders directly so encoding a value does no dispatch.
 
-                def encoder(ft, v, __):
-                    return cls._field_encoders[ft].to_wire(v)
+        Every compiled encoder maps None to None, so containers can call
+        child encoders without their own None checks.
+        """
+        field_type_name = cls._get_field_type_name(field_type)
+        if field_type in cls._field_encoders:
+            to_wire = cls._field_encoders[field_type].to_wire
 
-            elif is_enum(field_type):
+            def encoder(value, omit_none):
+                return to_wire(value) if value is not None else None
 
-                def encoder(_, v, __):
-                    return v.value
+        elif field_type in JSON_ENCODABLE_TYPES:
+            # Scalars pass straight through; every such field shares one
+            # singleton so to_dict pays no per-type closure at all.
+            encoder = _identity_encoder
 
-            elif field_type_name in OPTIONAL_TYPES:
-                # Attempt to encode the field with each union variant.
-                # TODO: Find a more reliable method than this since in the case 'Union[List[str], Dict[str, int]]' this
-                # will just output the dict keys as a list
-                union_fields = get_union_fields(field_type)
-                for variant, restrict_fields in union_fields:
-                    if _encode_restrictions_met(value, restrict_fields):
+        elif is_enum(field_type):
+            encoder = _enum_encoder
+
+        elif field_type_name in OPTIONAL_TYPES:
+            # Attempt to encode the field with each union variant.
+            # TODO: Find a more reliable method than this since in the case 'Union[List[str], Dict[str, int]]' this
+            # will just output the dict keys as a list
+            variants = []
+            for variant, restrict_fields in get_union_fields(field_type):
+                predicate, _ = _compile_restriction_predicates(restrict_fields)
+                variants.append((cls._get_encoder(variant), predicate))
+
+            def encoder(value, omit_none):
+                if value is None:
+                    return None
+                encoded = None
+                for variant_encoder, predicate in variants:
+                    if predicate(value):
                         try:
-                            encoded = cls._encode_field(
-                                variant, value, omit_none
-                            )
+                            encoded = variant_encoder(value, omit_none)
                             break
                         except (TypeError, AttributeError):
                             continue
@@ -367,98 +608,182 @@ class JsonSchemaMixin:
                         )
                     )
                 return encoded
-            elif field_type_name in ("Mapping", "Dict"):
-
-                def encoder(ft, val, o):
-                    return {
-                        cls._encode_field(
-                            ft.__args__[0], k, o
-                        ): cls._encode_field(ft.__args__[1], v, o)
-                        for k, v in val.items()
-                    }
-
-            elif field_type_name == "PatternProperty":
-                # TODO: is there some way to set __args__ on this so it can
-                # just re-use Dict/Mapping?
-                def encoder(ft, val, o):
-                    return {
-                        cls._encode_field(str, k, o): cls._encode_field(
-                            ft.TARGET_TYPE, v, o
-                        )
-                        for k, v in val.items()
-                    }
 
-            elif field_type_name == "List" or (
-                field_type_name == "Tuple" and ... in field_type.__args__
-            ):
+        elif field_type_name in ("Mapping", "Dict"):
+            key_encoder = cls._get_encoder(field_type.__args__[0])
+            value_encoder = cls._get_encoder(field_type.__args__[1])
 
-                def encoder(ft, val, o):
-                    if not isinstance(val, (tuple, list)):
-                        valtype = type(val)
-                        # raise a TypeError so the union encoder will capture it
-                        raise TypeError(
-                            f"Invalid type, expected {field_type_name} but got {valtype}"
-                        )
-                    return [
-                        cls._encode_field(ft.__args__[0], v, o) for v in val
-                    ]
+            def encoder(value, omit_none):
+                if value is None:
+                    return None
+                return {
+                    key_encoder(k, omit_none): value_encoder(v, omit_none)
+                    for k, v in value.items()
+                }
 
-            elif field_type_name == "Sequence":
+        elif field_type_name == "PatternProperty":
+            # TODO: is there some way to set __args__ on this so it can
+            # just re-use Dict/Mapping?
+            key_encoder = cls._get_encoder(str)
+            target_encoder = cls._get_encoder(field_type.TARGET_TYPE)
+
+            def encoder(value, omit_none):
+                if value is None:
+                    return None
+                return {
+                    key_encoder(k, omit_none): target_encoder(v, omit_none)
+                    for k, v in value.items()
+                }
+
+        elif field_type_name == "List" or (
+            field_type_name == "Tuple" and ... in field_type.__args__
+        ):
+            item_encoder = cls._get_encoder(field_type.__args__[0])
+
+            def encoder(value, omit_none):
+                if value is None:
+                    return None
+                if not isinstance(value, (tuple, list)):
+                    valtype = type(value)
+                    # raise a TypeError so the union encoder will capture it
+                    raise TypeError(
+                        f"Invalid type, expected {field_type_name} but got {valtype}"
+                    )
+                return [item_encoder(v, omit_none) for v in value]
+
+        elif field_type_name == "Sequence":
+            item_encoder = cls._get_encoder(field_type.__args__[0])
+
+            def encoder(value, omit_none):
+                if value is None:
+                    return None
+                return [item_encoder(v, omit_none) for v in value]
+
+        elif field_type_name == "Tuple":
+            item_encoders = [
+                cls._get_encoder(arg) for arg in field_type.__args__
+            ]
+
+            def encoder(value, omit_none):
+                if value is None:
+                    return None
+                return [
+                    item_encoders[idx](v, omit_none)
+                    for idx, v in enumerate(value)
+                ]
 
-                def encoder(ft, val, o):
-                    return [
-                        cls._encode_field(ft.__args__[0], v, o) for v in val
-                    ]
+        elif cls._is_json_schema_subclass(field_type):
+            # Only need to validate at the top level
+            def encoder(value, omit_none):
+                # this calls _local_to_dict in order to support
+                # combining this code with mashumaro
+                if value is None:
+                    return None
+                return value._local_to_dict(omit_none=omit_none)
 
-            elif field_type_name == "Tuple":
+        elif hasattr(field_type, "__supertype__"):  # NewType field
+            encoder = cls._get_encoder(field_type.__supertype__)
 
-                def encoder(ft, val, o):
-                    return [
-                        cls._encode_field(ft.__args__[idx], v, o)
-                        for idx, v in enumerate(val)
-                    ]
+        else:
+            encoder = _identity_encoder
 
-            elif cls._is_json_schema_subclass(field_type):
-                # Only need to validate at the top level
-                def encoder(_, v, o):
-                    # this calls _local_to_dict in order to support
-                    # combining this code with mashumaro
-                    return v._local_to_dict(omit_none=o)
+        return encoder
 
-            elif hasattr(field_type, "__supertype__"):  # NewType field
+    @classmethod
+    def _encode_field(
+        cls, field_type: Any, value: Any, omit_none: bool
+    ) -> Any:
+        if value is None:
+            return value
+        return cls._get_encoder(field_type)(value, omit_none)
 
-                def encoder(ft, v, o):
-                    return cls._encode_field(ft.__supertype__, v, o)
+    @classmethod
+    def _get_fields(cls) -> List[Tuple[Field, str]]:
+        # Look in cls.__dict__ rather than doing attribute lookup so
+        # subclasses don't pick up a parent's cached fields.
+        cached = cls.__dict__.get("_mapped_fields")
+        if cached is not None:
+            return cached
+
+        mapped_fields = []
+        type_hints = get_type_hints(cls)
+        field_mapping = cls.field_mapping()
+
+        for f in fields(cls):
+            # Skip internal fields
+            if f.name.startswith("_"):
+                continue
 
-            else:
+            # Note fields() doesn't resolve forward refs
+            f.type = type_hints[f.name]
 
-                def encoder(_, v, __):
-                    return v
+            mapped_fields.append((f, field_mapping.get(f.name, f.name)))
+        cls._mapped_fields = mapped_fields
 
-            cls._encode_cache[field_type] = encoder  # type: ignore
-        return encoder(field_type, value, omit_none)
+        # Compile the encode/decode records in the same first-use pass, so
+        # a class pays for all of its reflection exactly once. This can't
+        # happen at class-definition time: __init_subclass__ runs before
+        # the @dataclass decorator has built the fields, and forward refs
+        # may not be resolvable yet. The pairs cache must be populated
+        # first - compiling a union's restrictions can recurse back into
+        # _get_fields for classes that reference each other.
+        cls._get_field_records()
+        return mapped_fields
 
     @classmethod
-    def _get_fields(cls) -> List[Tuple[Field, str]]:
-        if cls._mapped_fields is None:
-            cls._mapped_fields = {}
-        if cls.__name__ not in cls._mapped_fields:
-            mapped_fields = []
-            type_hints = get_type_hints(cls)
-
-            for f in fields(cls):
-                # Skip internal fields
-                if f.name.startswith("_"):
-                    continue
+    def _get_field_records(
+        cls,
+    ) -> List[Tuple[str, str, _ValueEncoder, _ValueDecoder]]:
+        cached = cls.__dict__.get("_field_records")
+        if cached is not None:
+            return cached
+
+        records = [
+            (
+                field.name,
+                target_field,
+                cls._get_encoder(field.type),
+                cls._get_decoder(field.type),
+            )
+            for field, target_field in cls._get_fields()
+        ]
+        cls._field_records = records
+        return records
 
-                # Note fields() doesn't resolve forward refs
-                f.type = type_hints[f.name]
+    @classmethod
+    def _get_decode_records(
+        cls,
+    ) -> Tuple[
+        List[Tuple[str, str, _ValueDecoder, bool]],
+        List[Tuple[str, str, _ValueDecoder, bool]],
+    ]:
+        cached = cls.__dict__.get("_decode_records")
+        if cached is not None:
+            return cached
+
+        init_records = []
+        post_records = []
+        for field, target_field in cls._get_fields():
+            # fields with no default must be decoded even when their key
+            # is missing from the data
+            required = (
+                field.default == MISSING
+                and field.default_factory == MISSING  # type: ignore
+            )
+            record = (
+                field.name,
+                target_field,
+                cls._get_decoder(field.type),
+                required,
+            )
+            if field.init:
+                init_records.append(record)
+            else:
+                post_records.append(record)
 
-                mapped_fields.append(
-                    (f, cls.field_mapping().get(f.name, f.name))
-                )
-            cls._mapped_fields[cls.__name__] = mapped_fields
-        return cls._mapped_fields[cls.__name__]
+        records = (init_records, post_records)
+        cls._decode_records = records
+        return records
 
     @classmethod
     def _get_field_names(cls):
@@ -468,6 +793,20 @@ class JsonSchemaMixin:
             field_names.append(element[1])
         return field_names
 
+    def _to_dict_omit_none(self) -> JsonDict:
+        data = {}
+        for name, target_field, encoder, _ in self._get_field_records():
+            value = encoder(getattr(self, name), True)
+            if value is not None:
+                data[target_field] = value
+        return data
+
+    def _to_dict_keep_none(self) -> JsonDict:
+        data = {}
+        for name, target_field, encoder, _ in self._get_field_records():
+            data[target_field] = encoder(getattr(self, name), False)
+        return data
+
     def to_dict(
         self, omit_none: bool = True, validate: bool = False
     ) -> JsonDict:
@@ -475,141 +814,341 @@ class JsonSchemaMixin:
 
         If omit_none (default True) is specified, any items with value None are removed
         """
-        data = {}
-        for field, target_field in self._get_fields():
-            value = self._encode_field(
-                field.type, getattr(self, field.name), omit_none
-            )
-            if omit_none and value is None:
-                continue
-            data[target_field] = value
+        if omit_none:
+            data = self._to_dict_omit_none()
+        else:
+            data = self._to_dict_keep_none()
         if validate:
             self.validate(data)
         return data
 
     @classmethod
-    def _decode_field(
-        cls, field: str, field_type: Any, value: Any, validate: bool
-    ) -> Any:
-        if value is None:
-            return None
-        decoder = None
+    def _get_decoder(cls, field_type: Any) -> _ValueDecoder:
+        """Return the compiled decoder for the given field type, building
+        and caching it on first use.
+        """
+        cache = cls.__dict__.get("_decode_cache")
+        if cache is None:
+            cache = {}
+            cls._decode_cache = cache
         try:
-            decoder = cls._decode_cache[field_type]  # type: ignore
-        except (KeyError, TypeError):
-            if (
-                type(value) in JSON_ENCODABLE_TYPES
-                and field_type in JSON_ENCODABLE_TYPES
-            ):
-                return value
-            if cls._decode_cache is None:
-                cls._decode_cache = {}
-            # Replace any nested dictionaries with their targets
-            field_type_name = cls._get_field_type_name(field_type)
+            return cache[field_type]
+        except KeyError:
+            decoder = cls._compile_decoder(field_type)
+            cache[field_type] = decoder
+            return decoder
+        except TypeError:
+            # unhashable field types can't be cached
+            return cls._compile_decoder(field_type)
 
-            if field_type in cls._field_encoders:
+    @classmethod
+    def _compile_decoder(cls, field_type: Any) -> _ValueDecoder:
+        """Build a decoder specialized to the given field type. Like
+        `_compile_encoder`, this resolves child decoders once so the
+        returned closure does no type inspection per value.
 
-                def decoder(_, ft, val):
-                    return cls._field_encoders[ft].to_python(val)
+        Every compiled decoder maps None to None.
+        """
+        decoder = None
+        field_type_name = cls._get_field_type_name(field_type)
+
+        if field_type in cls._field_encoders:
+            to_python = cls._field_encoders[field_type].to_python
 
-            elif cls._is_json_schema_subclass(field_type):
+            def decoder(field, value, validate):
+                return to_python(value) if value is not None else None
 
-                def decoder(_, ft, val):
-                    return ft.from_dict(val, validate=validate)
+        elif cls._is_json_schema_subclass(field_type):
 
-            elif field_type_name in OPTIONAL_TYPES:
-                # Attempt to decode the value using each decoder in turn
-                union_excs = (
-                    AttributeError,
-                    TypeError,
-                    ValueError,
-                    ValidationError,
+            def decoder(field, value, validate):
+                if value is None:
+                    return None
+                return field_type.from_dict(value, validate=validate)
+
+        elif field_type_name in OPTIONAL_TYPES:
+            decoder = cls._compile_union_decoder(field_type)
+
+        elif field_type_name in ("Mapping", "Dict"):
+            key_decoder = cls._get_decoder(field_type.__args__[0])
+            value_decoder = cls._get_decoder(field_type.__args__[1])
+
+            def decoder(field, value, validate):
+                if value is None:
+                    return None
+                return {
+                    key_decoder(field, k, validate): value_decoder(
+                        field, v, validate
+                    )
+                    for k, v in value.items()
+                }
+
+        elif field_type_name == "List" or (
+            field_type_name == "Tuple" and ... in field_type.__args__
+        ):
+            seq_type = tuple if field_type_name == "Tuple" else list
+            item_decoder = cls._get_decoder(field_type.__args__[0])
+
+            def decoder(field, value, validate):
+                if value is None:
+                    return None
+                if not isinstance(value, (tuple, list)):
+                    valtype = type(value)
+                    # raise a TypeError so the Union decoder will capture it
+                    raise TypeError(
+                        f"Invalid type, expected {field_type_name} but got {valtype}"
+                    )
+                return seq_type(
+                    item_decoder(field, v, validate) for v in value
                 )
-                errors: Dict[str, Exception] = {}
 
-                union_fields = get_union_fields(field_type)
-                for variant, restrict_fields in union_fields:
-                    if _decode_restrictions_met(value, restrict_fields):
-                        try:
-                            return cls._decode_field(
-                                field, variant, value, True
-                            )
-                        except union_excs as exc:
-                            errors[str(variant)] = exc
-                            continue
+        # if you want to allow strings as sequences for some reason, you
+        # can still use 'Sequence' to get back a list of characters...
+        elif field_type_name == "Sequence":
+            item_decoder = cls._get_decoder(field_type.__args__[0])
+
+            def decoder(field, value, validate):
+                if value is None:
+                    return None
+                return list(item_decoder(field, v, validate) for v in value)
+
+        elif field_type_name == "Tuple":
+            item_decoders = [
+                cls._get_decoder(arg) for arg in field_type.__args__
+            ]
+
+            def decoder(field, value, validate):
+                if value is None:
+                    return None
+                return tuple(
+                    item_decoders[idx](field, v, validate)
+                    for idx, v in enumerate(value)
+                )
 
-                # none of the unions decoded, so report about all of them
-                raise FutureValidationError(field, errors)
+        elif hasattr(field_type, "__supertype__"):  # NewType field
+            decoder = cls._get_decoder(field_type.__supertype__)
+
+        elif is_enum(field_type):
+            # hit the value-to-member map directly; Enum.__call__ does the
+            # same lookup but through the metaclass with a __missing__
+            # protocol around it
+            value_map = field_type._value2member_map_
+
+            def decoder(field, value, validate):
+                if value is None:
+                    return None
+                try:
+                    member = value_map.get(value, _SENTINEL)
+                except TypeError:
+                    # unhashable; let the metaclass try by-value search
+                    member = _SENTINEL
+                if member is not _SENTINEL:
+                    return member
+                return field_type(value)
+
+        elif field_type is Any:
+
+            def decoder(field, value, validate):
+                return value
 
-            elif field_type_name in ("Mapping", "Dict"):
+        elif field_type in JSON_ENCODABLE_TYPES:
 
-                def decoder(f, ft, val):
-                    return {
-                        cls._decode_field(
-                            f, ft.__args__[0], k, validate
-                        ): cls._decode_field(f, ft.__args__[1], v, validate)
-                        for k, v in val.items()
-                    }
+            def decoder(field, value, validate):
+                if value is None or type(value) in JSON_ENCODABLE_TYPES:
+                    return value
+                raise ValidationError(
+                    f"Unable to decode value for '{field}: {field_type_name}' (value={value})"
+                )
 
-            elif field_type_name == "List" or (
-                field_type_name == "Tuple" and ... in field_type.__args__
-            ):
-                seq_type = tuple if field_type_name == "Tuple" else list
-
-                def decoder(f, ft, val):
-                    if not isinstance(val, (tuple, list)):
-                        valtype = type(val)
-                        # raise a TypeError so the Union decoder will capture it
-                        raise TypeError(
-                            f"Invalid type, expected {field_type_name} but got {valtype}"
-                        )
-                    return seq_type(
-                        cls._decode_field(f, ft.__args__[0], v, validate)
-                        for v in val
-                    )
+        if decoder is None:
 
-            # if you want to allow strings as sequences for some reason, you
-            # can still use 'Sequence' to get back a list of characters...
-            elif field_type_name == "Sequence":
+            def decoder(field, value, validate):
+                if value is None:
+                    return None
+                raise ValidationError(
+                    f"Unable to decode value for '{field}: {field_type_name}' (value={value})"
+                )
 
-                def decoder(f, ft, val):
-                    return list(
-                        cls._decode_field(f, ft.__args__[0], v, validate)
-                        for v in val
-                    )
+        return decoder
 
-            elif field_type_name == "Tuple":
+    @classmethod
+    def _compile_union_decoder(cls, field_type: Any) -> _ValueDecoder:
+        """Build a decoder for a Union. The common shapes get specialized:
+        a plain Optional[X] skips the variant loop entirely, and a union
+        of scalars collapses to a single type check. Everything else
+        attempts each variant's decoder in turn; restricted variants sort
+        first, so tagged variants win before any unrestricted catch-all
+        gets a chance.
+        """
+        union_fields = get_union_fields(field_type)
+        variant_types = [variant for variant, _ in union_fields]
+        unrestricted = all(
+            restrictions is None for _, restrictions in union_fields
+        )
 
-                def decoder(f, ft, val):
-                    return tuple(
-                        cls._decode_field(f, ft.__args__[idx], v, validate)
-                        for idx, v in enumerate(val)
+        if (
+            unrestricted
+            and len(variant_types) == 2
+            and type(None) in variant_types
+        ):
+            # Optional[X]: decode with X directly. The NoneType variant
+            # historically accepted any scalar, so keep that fallback.
+            other = next(v for v in variant_types if v is not type(None))
+            other_name = str(other)
+            child_decoder = cls._get_decoder(other)
+
+            def optional_decoder(field, value, validate):
+                if value is None:
+                    return None
+                try:
+                    return child_decoder(field, value, True)
+                except _UNION_DECODE_EXCEPTIONS as exc:
+                    if type(value) in JSON_ENCODABLE_TYPES:
+                        return value
+                    raise FutureValidationError(field, {other_name: exc})
+
+            return optional_decoder
+
+        if unrestricted and all(
+            variant in JSON_ENCODABLE_TYPES for variant in variant_types
+        ):
+            # a union of scalars accepts any scalar and nothing else
+            variant_names = [str(variant) for variant in variant_types]
+
+            def scalar_decoder(field, value, validate):
+                if value is None or type(value) in JSON_ENCODABLE_TYPES:
+                    return value
+                errors: Dict[str, Exception] = {
+                    name: ValidationError(
+                        f"Unable to decode value for '{field}: {name}' (value={value})"
                     )
+                    for name in variant_names
+                }
+                raise FutureValidationError(field, errors)
 
-            elif hasattr(field_type, "__supertype__"):  # NewType field
+            return scalar_decoder
 
-                def decoder(f, ft, val):
-                    return cls._decode_field(
-                        f, ft.__supertype__, val, validate
-                    )
+        variants = []
+        for variant, restrict_fields in union_fields:
+            _, predicate = _compile_restriction_predicates(restrict_fields)
+            variants.append(
+                (str(variant), cls._get_decoder(variant), predicate)
+            )
 
-            elif is_enum(field_type):
+        # when every variant is restricted on a shared set of keys, those
+        # keys discriminate: one dict lookup narrows the loop to the
+        # variants whose tag values match
+        discriminants = _compile_union_discriminants(union_fields, variants)
+        if discriminants is not None:
+            discriminant_keys, table = discriminants
+
+            def discriminant_decoder(field, value, validate):
+                if value is None:
+                    return None
+                candidates = None
+                get = getattr(value, "get", None)
+                if get is not None:
+                    try:
+                        candidates = table.get(
+                            tuple(get(k, _SENTINEL) for k in discriminant_keys)
+                        )
+                    except TypeError:
+                        # unhashable tag value; let the full loop decide
+                        candidates = None
+                if candidates is None:
+                    candidates = variants
+                errors: Dict[str, Exception] = {}
+                for name, variant_decoder, predicate in candidates:
+                    if predicate(value):
+                        try:
+                            return variant_decoder(field, value, True)
+                        except _UNION_DECODE_EXCEPTIONS as exc:
+                            errors[name] = exc
+                            continue
+                raise FutureValidationError(field, errors)
 
-                def decoder(_, ft, val):
-                    return ft(val)
+            return discriminant_decoder
 
-            elif field_type is Any:
+        if unrestricted:
+            # when exactly one variant can decode a given concrete json
+            # type, the value's type picks that variant directly and the
+            # happy path raises no exceptions at all; ambiguous types
+            # (say, two list-shaped variants) stay with the loop
+            dispatch = cls._compile_union_dispatch(variant_types, variants)
+        else:
+            dispatch = {}
+
+        def decoder(field, value, validate):
+            if value is None:
+                return None
+            direct = dispatch.get(type(value))
+            if direct is not None:
+                try:
+                    return direct(field, value, True)
+                except _UNION_DECODE_EXCEPTIONS:
+                    # leave the error reporting to the full loop
+                    pass
+            errors: Dict[str, Exception] = {}
+            for name, variant_decoder, predicate in variants:
+                if predicate(value):
+                    try:
+                        return variant_decoder(field, value, True)
+                    except _UNION_DECODE_EXCEPTIONS as exc:
+                        errors[name] = exc
+                        continue
+
+            # none of the unions decoded, so report about all of them
+            raise FutureValidationError(field, errors)
+
+        return decoder
 
-                def decoder(_, __, val):
-                    return val
+    @classmethod
+    def _compile_union_dispatch(
+        cls, variant_types: List[Any], variants: List[Tuple[Any, ...]]
+    ) -> Dict[type, "_ValueDecoder"]:
+        """Map concrete json types to the single variant decoder that
+        handles them, for unions where every variant's wire shape is
+        unambiguous. Types claimed by more than one variant are left
+        out, and a variant whose shape can't be pinned down (a custom
+        encoder, enum, or NewType can accept values a later variant
+        would claim) disables the dispatch entirely - jumping past it
+        would break declaration-order semantics. Values of unmapped
+        types go through the variant loop.
+        """
+        claims: Dict[type, List["_ValueDecoder"]] = {}
+        for variant, (_, variant_decoder, _pred) in zip(
+            variant_types, variants
+        ):
+            if variant is type(None):
+                # None is handled before the dispatch lookup, and for
+                # everything else this arm ties with the scalar leniency
+                # the loop has anyway
+                continue
+            name = cls._get_field_type_name(variant)
+            if variant in cls._field_encoders:
+                return {}
+            elif name in ("List", "Sequence", "Tuple"):
+                claimed: Tuple[type, ...] = (list,)
+            elif name in ("Dict", "Mapping") or variant in _JSM_SUBCLASSES:
+                claimed = (dict,)
+            elif variant in JSON_ENCODABLE_TYPES:
+                claimed = (variant,)
+            else:
+                return {}
+            for json_type in claimed:
+                claims.setdefault(json_type, []).append(variant_decoder)
+        return {
+            json_type: decoders[0]
+            for json_type, decoders in claims.items()
+            if len(decoders) == 1
+        }
 
-            if decoder is None:
-                raise ValidationError(
-                    f"Unable to decode value for '{field}: {field_type_name}' (value={value})"
-                )
-                return value
-            cls._decode_cache[field_type] = decoder
-        return decoder(field, field_type, value)
+    @classmethod
+    def _decode_field(
+        cls, field: str, field_type: Any, value: Any, validate: bool
+    ) -> Any:
+        if value is None:
+            return None
+        return cls._get_decoder(field_type)(field, value, validate)
 
     @classmethod
     def _find_matching_validator(cls: Type[T], data: JsonDict) -> T:
@@ -637,39 +1176,44 @@ class JsonSchemaMixin:
         if cls is JsonSchemaMixin:
             return cls._find_matching_validator(data)
 
-        init_values: Dict[str, Any] = {}
-        non_init_values: Dict[str, Any] = {}
-
         if validate:
             cls.validate(data)
 
-        for field, target_field in cls._get_fields():
-            values = init_values if field.init else non_init_values
-            if target_field in data or (
-                field.default == MISSING
-                and field.default_factory == MISSING  # type: ignore
-            ):
-                values[field.name] = cls._decode_field(
-                    field.name, field.type, data.get(target_field), validate
-                )
+        init_records, post_records = cls._get_decode_records()
+
+        init_values: Dict[str, Any] = {}
+        for name, target_field, decoder, required in init_records:
+            value = data.get(target_field, _SENTINEL)
+            if value is _SENTINEL:
+                if not required:
+                    continue
+                value = None
+            init_values[name] = decoder(name, value, validate)
 
         # Need to ignore the type error here, since mypy doesn't know that
         # subclasses are dataclasses
         instance = cls(**init_values)  # type: ignore
 
-        for field_name, value in non_init_values.items():
-            setattr(instance, field_name, value)
+        for name, target_field, decoder, required in post_records:
+            value = data.get(target_field, _SENTINEL)
+            if value is _SENTINEL:
+                if not required:
+                    continue
+                value = None
+            setattr(instance, name, decoder(name, value, validate))
 
         return instance
 
     @staticmethod
     def _is_json_schema_subclass(field_type: Type) -> bool:
-        return issubclass_safe(field_type, JsonSchemaMixin)
+        # WeakSet.__contains__ returns False for non-weak-referenceable
+        # values, so typing aliases are safely rejected
+        return field_type in _JSM_SUBCLASSES
 
     @staticmethod
     def _has_definition(field_type: Type) -> bool:
         return (
-            issubclass_safe(field_type, JsonSchemaMixin)
+            field_type in _JSM_SUBCLASSES
             and field_type.__name__ != "PatternProperty"
         )
 
@@ -963,25 +1507,119 @@ class JsonSchemaMixin:
             )
             return cls.all_json_schemas()
 
-        definitions: JsonDict = {}
-        return cls._json_schema_recursive(
-            embeddable=embeddable, definitions=definitions
-        )
+        cache = cls.__dict__.get("_final_schemas")
+        if cache is None:
+            cache = {}
+            cls._final_schemas = cache
+
+        schema = cache.get(embeddable)
+        if schema is None:
+            definitions: JsonDict = {}
+            schema = cls._json_schema_recursive(
+                embeddable=embeddable, definitions=definitions
+            )
+            cache[embeddable] = schema
+        return schema
 
     @staticmethod
     def _get_field_type_name(field_type: Any) -> str:
+        # Generic aliases resolve through their origin: 'typing' aliases
+        # lack __name__ entirely, while builtin generics (list[str]) have
+        # the lowercase builtin's name, which the dispatch doesn't use.
+        origin = get_origin(field_type)
+        if origin is not None:
+            name = _ORIGIN_NAMES.get(origin)
+            if name is not None:
+                return name
         try:
             return field_type.__name__
         except AttributeError:
-            # The types in the 'typing' module lack the __name__ attribute
-            match = re.match(r"typing\.([A-Za-z]+)", str(field_type))
-            return str(field_type) if match is None else match.group(1)
+            return str(field_type)
+
+    @classmethod
+    def _get_validator(cls) -> jsonschema.Draft7Validator:
+        """Return the cached validator for this class, building it (and
+        the schema it wraps) on first use.
+        """
+        validator = cls.__dict__.get("_validator")
+        if validator is None:
+            schema = cls.json_schema()
+            # a canonical dump is cheaper than a meta-schema check, and
+            # lets classes that generate identical schemas share one
+            # validator instead of building their own
+            try:
+                key: Optional[str] = json.dumps(schema, sort_keys=True)
+            except TypeError:
+                key = None
+            if key is not None:
+                validator = _VALIDATORS_BY_SCHEMA.get(key)
+                if validator is not None:
+                    _VALIDATORS_BY_SCHEMA.move_to_end(key)
+            if validator is None:
+                schema = _validate_schema(cls)
+                # format_checker stays None so iter_errors never runs
+                # format callbacks against every string in the document
+                validator = jsonschema.Draft7Validator(
+                    schema, format_checker=None
+                )
+                if key is not None:
+                    _VALIDATORS_BY_SCHEMA[key] = validator
+                    while len(_VALIDATORS_BY_SCHEMA) > _VALIDATOR_CACHE_SIZE:
+                        _VALIDATORS_BY_SCHEMA.popitem(last=False)
+            # hologram-generated top-level schemas are object schemas, so
+            # a non-dict can be rejected without entering jsonschema at
+            # all; precomputed here so the gate is one attribute read
+            cls._expects_object = validator.schema.get("type") == "object"
+            cls._validator = validator
+        return validator
+
+    @classmethod
+    def compile_all(cls):
+        """Build the schema and validator for this class and every
+        subclass of it up front, instead of lazily at each class's first
+        validate() call. Classes whose schemas don't build (bad restrict
+        metadata or an unresolvable forward reference, say) are skipped
+        and keep raising at use time.
+        """
+        seen = set()
+        stack = [cls]
+        while stack:
+            klass = stack.pop()
+            if klass in seen:
+                continue
+            seen.add(klass)
+            stack.extend(klass.__subclasses__())
+            if klass is JsonSchemaMixin or not is_dataclass(klass):
+                continue
+            try:
+                klass._get_validator()
+            except (ValidationError, NameError, TypeError):
+                # get_type_hints raises NameError/TypeError on forward
+                # references that can't be resolved yet
+                continue
 
     @classmethod
     def validate(cls, data: Any):
-        h_cls = cast(Hashable, cls)
-        schema = _validate_schema(h_cls)
-        validator = jsonschema.Draft7Validator(schema)
+        validator = cls._get_validator()
+        if cls.__dict__.get("_expects_object") and not isinstance(data, dict):
+            # carry the attributes jsonschema's own type error would, so
+            # callers inspecting error.validator etc. see no difference
+            raise ValidationError(
+                "%r is not of type 'object'" % (data,),
+                validator="type",
+                validator_value="object",
+                instance=data,
+                schema=validator.schema,
+            )
+        # iter_errors is lazy, so taking the first error short-circuits as
+        # soon as the data is known invalid; the valid path never
+        # materializes an error object at all. The iter() wrapper is for
+        # mypy's benefit: the stub returns an Iterable, not an Iterator.
         error = next(iter(validator.iter_errors(data)), None)
         if error is not None:
             raise ValidationError.create_from(error) from error
+
+
+# issubclass(JsonSchemaMixin, JsonSchemaMixin) is true, so the base class
+# belongs in the registry as well
+_JSM_SUBCLASSES.add(JsonSchemaMixin)
@@ -1,49 +1,97 @@
+import sys
 from dataclasses import fields
 from enum import Enum
-from typing import Type
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Type
 
 from hologram import JsonSchemaMixin, FieldEncoder
 
 
+@lru_cache(maxsize=1024)
+def _cached_fields(cls: type) -> Tuple:
+    # fields() rebuilds its tuple from __dataclass_fields__ on every call;
+    # the result is frozen once the class is defined, so cache it.
+    # Bounded, so dynamically created classes aren't pinned forever.
+    return fields(cls)
+
+
 class StrEnum(str, Enum):
-    def __str__(self) -> str:
-        return self.value
+    # members are strings holding their value, so the C-level str slot
+    # already renders them correctly - no Python frame per str() call
+    __str__ = str.__str__
 
     # https://docs.python.org/3.6/library/enum.html#using-automatic-values
     def _generate_next_value_(name, start, count, last_values):
         return name
 
 
+@lru_cache(maxsize=1024)
 def StrLiteral(value: str) -> Type[StrEnum]:
+    # cached: each literal gets exactly one enum class, so repeated calls
+    # (and the schema/encoder caches keyed on the class) can be shared.
+    # Bounded like _cached_fields, so the classes aren't pinned forever
     # mypy doesn't think this works, but it does
     return StrEnum(value, value)  # type: ignore
 
 
+# patterns already registered, so repeat calls don't churn the encoder
+# registry (registering invalidates the schema/validator caches)
+_registered_patterns: Dict[Any, str] = {}
+
+
+def _pattern_encoder(pattern: str) -> FieldEncoder:
+    class PatternEncoder(FieldEncoder):
+        # a class attribute rather than a property: the schema dict is
+        # built once at class creation and each access is a plain
+        # attribute read instead of a descriptor call
+        json_schema = {"type": "string", "pattern": pattern}
+
+    return PatternEncoder()
+
+
 def register_pattern(base_type: Type, pattern: str) -> None:
     """base_type should be a typing.NewType that should always have the given
     regex pattern. That means that its underlying type ('__supertype__') had
     better be a str!
     """
+    register_patterns({base_type: pattern})
 
-    class PatternEncoder(FieldEncoder):
-        @property
-        def json_schema(self):
-            return {"type": "string", "pattern": pattern}
 
-    JsonSchemaMixin.register_field_encoders({base_type: PatternEncoder()})
+def register_patterns(patterns: Dict[Type, str]) -> None:
+    """Register many pattern types at once with a single update to the
+    encoder registry, and therefore a single cache invalidation, instead
+    of one per pattern.
+    """
+    encoders = {
+        base_type: _pattern_encoder(pattern)
+        for base_type, pattern in patterns.items()
+        if _registered_patterns.get(base_type) != pattern
+    }
+    if not encoders:
+        return
+    JsonSchemaMixin.register_field_encoders(encoders)
+    for base_type in encoders:
+        _registered_patterns[base_type] = patterns[base_type]
 
 
 class HyphenatedJsonSchemaMixin(JsonSchemaMixin):
     @classmethod
     def field_mapping(cls):
-        result = {}
-        for field in fields(cls):
-            skip = field.metadata.get("preserve_underscore")
-            if skip:
-                continue
-
-            if "_" in field.name:
-                result[field.name] = field.name.replace("_", "-")
+        # computed once per class; looked up via cls.__dict__ so
+        # subclasses don't inherit a parent's mapping
+        cached = cls.__dict__.get("_hologram_field_mapping")
+        if cached is not None:
+            return cached
+
+        # interned so downstream dict probes on these names compare by
+        # pointer; one-time cost, the mapping is cached per class
+        result = {
+            sys.intern(field.name): sys.intern(field.name.replace("_", "-"))
+            for field in _cached_fields(cls)
+            if "_" in field.name
+            and not field.metadata.get("preserve_underscore")
+        }
+        cls._hologram_field_mapping = result
         return result
 
 
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from setuptools import setup
 
 requires = [
@@ -10,7 +12,7 @@ package_version = "0.0.16"
 
 
 def read(f):
-    return open(f, encoding="utf-8").read()
+    return Path(f).read_text(encoding="utf-8")
 
 
 setup(
@@ -4,8 +4,18 @@ from enum import Enum
 from datetime import datetime
 from uuid import UUID
 
+import pytest
+
 from hologram import JsonSchemaMixin, FieldEncoder
 
+
+@pytest.fixture(scope="session", autouse=True)
+def precompiled_schemas():
+    # pay the schema/validator build cost once for every class the test
+    # modules define, rather than inside whichever test runs first
+    JsonSchemaMixin.compile_all()
+
+
 Postcode = NewType("Postcode", str)
 
 
@@ -21,7 +21,6 @@ import pytest
 
 from hologram import ValidationError
 
-
 FOO_SCHEMA = {
     "description": "A foo that foos",
     "properties": {
@@ -371,3 +370,34 @@ def test_required_union_field_no_default():
     schema = FooBar.json_schema(embeddable=True)
 
     assert "id" in schema["FooBar"]["required"]
+
+
+def test_compile_all():
+    JsonSchemaMixin.compile_all()
+    # every dataclass subclass should now have a cached validator
+    assert Point.__dict__.get("_validator") is not None
+    assert Product.__dict__.get("_validator") is not None
+    Point.validate({"z": 1.0, "y": 2.0})
+
+
+def test_compile_all_skips_unresolvable_refs():
+    @dataclass
+    class HasBadRef(JsonSchemaMixin):
+        other: "NotDefinedAnywhere"  # noqa: F821
+
+    # the broken subclass must not abort the warmup for everyone else
+    JsonSchemaMixin.compile_all()
+    assert HasBadRef.__dict__.get("_validator") is None
+    assert Point.__dict__.get("_validator") is not None
+
+
+def test_set_validator_cache_size():
+    JsonSchemaMixin.set_validator_cache_size(1)
+    try:
+        # shrinking the shared cache must not break validation
+        Point.validate({"z": 1.0, "y": 2.0})
+        Product.validate({"name": "hammer"})
+        with pytest.raises(ValidationError):
+            Point.validate({"z": 1.0, "y": "wrong"})
+    finally:
+        JsonSchemaMixin.set_validator_cache_size(1024)
@@ -5,9 +5,12 @@ import pytest
 from dataclasses import dataclass
 from typing import NewType, List, Union
 
-
 ListOrTuple = NewType("ListOrTuple", List[str])
 
+# exact-type membership instead of isinstance: one hash lookup, no MRO
+# walk, and subclasses don't sneak through
+_SEQ_TYPES = frozenset((list, tuple))
+
 
 class ListOrTupleEncoder(FieldEncoder):
     def to_wire(self, value):
@@ -23,13 +26,13 @@ class ListOrTupleEncoder(FieldEncoder):
 
 class ListOrTupleOrAloneEncoder(FieldEncoder):
     def to_wire(self, value):
-        if isinstance(value, (tuple, list)):
+        if type(value) in _SEQ_TYPES:
             return list(value)
         else:
             return [value]
 
     def to_python(self, value):
-        if isinstance(value, (tuple, list)):
+        if type(value) in _SEQ_TYPES:
             return list(value)
         else:
             return [value]
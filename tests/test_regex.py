@@ -4,12 +4,15 @@ from dataclasses import dataclass
 from typing import NewType
 
 from hologram import ValidationError, JsonSchemaMixin
-from hologram.helpers import register_pattern
-
+from hologram.helpers import register_pattern, register_patterns
 
 Uppercase = NewType("Uppercase", str)
 register_pattern(Uppercase, r"[A-Z]+")
 
+Lowercase = NewType("Lowercase", str)
+Digits = NewType("Digits", str)
+register_patterns({Lowercase: r"[a-z]+", Digits: r"[0-9]+"})
+
 
 @dataclass
 class Loud(JsonSchemaMixin):
@@ -38,3 +41,21 @@ def test_loud(loud, loud_dict, too_quiet):
 
     with pytest.raises(ValidationError):
         Loud.from_dict(too_quiet)
+
+
+@dataclass
+class Mixed(JsonSchemaMixin):
+    quiet: Lowercase
+    count: Digits
+
+
+def test_batch_registered():
+    obj = Mixed(quiet="shhh", count="123")
+    dct = {"quiet": "shhh", "count": "123"}
+    assert obj.to_dict() == dct
+    assert Mixed.from_dict(dct) == obj
+
+    with pytest.raises(ValidationError):
+        Mixed.from_dict({"quiet": "SHOUT", "count": "123"})
+    with pytest.raises(ValidationError):
+        Mixed.from_dict({"quiet": "shhh", "count": "abc"})
@@ -1,7 +1,7 @@
 import pytest
 
 from dataclasses import dataclass, field
-from typing import Union
+from typing import List, Union
 
 from hologram import JsonSchemaMixin, ValidationError
 from hologram.helpers import StrEnum
@@ -245,3 +245,26 @@ def test_multi_overlapping_restricted():
 
         assert cls.from_dict(x.to_dict()) == x
         assert cls.from_dict(y.to_dict()) == y
+
+
+@dataclass
+class ListFoo(JsonSchemaMixin):
+    # 'foo' collides with the restricted key but holds an unhashable value
+    foo: List[int]
+
+
+@dataclass
+class HasRestrictedAndListFoo(JsonSchemaMixin):
+    thing: Union[RestrictAB, ListFoo]
+
+
+def test_unhashable_value_under_restricted_key():
+    x = HasRestrictedAndListFoo(thing=ListFoo(foo=[1, 2]))
+    assert x.to_dict() == {"thing": {"foo": [1, 2]}}
+    assert (
+        HasRestrictedAndListFoo.from_dict(
+            {"thing": {"foo": [1, 2]}}, validate=False
+        )
+        == x
+    )
+    assert HasRestrictedAndListFoo.from_dict(x.to_dict(), validate=True) == x
@@ -1,8 +1,11 @@
 import pytest
 
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
 from typing import Union, Optional, List, Dict, Any
 import re
+import sys
 
 from hologram import JsonSchemaMixin, ValidationError
 
@@ -80,6 +83,62 @@ def test_long_union_decoding():
             raise
 
 
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="PEP 604 unions need python 3.10"
+)
+def test_pep604_union_round_trip():
+    @dataclass
+    class HasPipeUnions(JsonSchemaMixin):
+        my_field: list[str] | str | None = None
+
+    for field_value in (None, [">=0.0.0"], ">=0.0.0"):
+        obj = HasPipeUnions(my_field=field_value)
+        dct = {"my_field": field_value}
+        assert HasPipeUnions.from_dict(dct) == obj
+        assert obj.to_dict(omit_none=False) == dct
+
+    schema = HasPipeUnions.json_schema()
+    assert "oneOf" in schema["properties"]["my_field"]
+    assert "my_field" not in schema.get("required", [])
+
+    with pytest.raises(ValidationError):
+        HasPipeUnions.from_dict({"my_field": {">=0.0.0"}})
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class HasEncodedUnion(JsonSchemaMixin):
+    when: Union[datetime, str]
+
+
+@dataclass
+class HasEnumFirstUnion(JsonSchemaMixin):
+    color: Union[Color, str]
+
+
+def test_encoded_arm_decoded_first():
+    # the datetime arm is declared first, so a parseable string must come
+    # back as a datetime rather than falling through to the str arm.
+    # validate=False because a date-time string satisfies both oneOf
+    # branches, which strict validation rejects
+    obj = HasEncodedUnion(when=datetime(2021, 1, 1, tzinfo=timezone.utc))
+    decoded = HasEncodedUnion.from_dict(obj.to_dict(), validate=False)
+    assert isinstance(decoded.when, datetime)
+    assert decoded == obj
+
+
+def test_enum_arm_decoded_first():
+    decoded = HasEnumFirstUnion.from_dict({"color": "red"}, validate=False)
+    assert decoded.color is Color.RED
+    # strings that aren't members still fall through to the str arm
+    decoded = HasEnumFirstUnion.from_dict({"color": "other"}, validate=False)
+    assert decoded.color == "other"
+
+
 @dataclass
 class UnionDefinition(JsonSchemaMixin):
     my_field: Union[str, Dict[str, Any]]
@@ -4,7 +4,10 @@ from typing import Any, Dict, Iterable
 from jsonschema.exceptions import ValidationError as ValidationError
 
 class Draft7Validator:
-    def __init__(self, schema: Dict[str, Any]) -> None: ...
+    schema: Dict[str, Any]
+    def __init__(
+        self, schema: Dict[str, Any], format_checker: Any = ...
+    ) -> None: ...
     @classmethod
     def check_schema(cls, schema: Dict[str, Any]) -> None: ...
     def iter_errors(